@@ -52,7 +52,6 @@ class PublicDBusInterface(object):
 
     __hold_clients: dict
 
-    __watch_changes_timeout_source: typing.Optional[int] = None
     __auto_stop_timeout_source: typing.Optional[int] = None
     __stop_kolibri_timeout_source: typing.Optional[int] = None
 
@@ -96,11 +95,9 @@ class PublicDBusInterface(object):
         self.__stop_kolibri_timeout_interval = value
 
     def init(self):
-        self.__begin_watch_changes_timeout()
         self.__begin_auto_stop_timeout()
 
     def shutdown(self):
-        self.__cancel_watch_changes_timeout()
         self.__cancel_auto_stop_timeout()
 
     def set_accounts_service(self, accounts_service: AccountsServiceManager):
@@ -250,24 +247,7 @@ class PublicDBusInterface(object):
         interface.complete_get_metadata_for_item_ids(invocation, result_variant)
         return True
 
-    def __begin_watch_changes_timeout(self):
-        if self.__watch_changes_timeout_source:
-            return
-        self.__watch_changes_timeout_source = GLib.timeout_add_seconds(
-            1, self.__watch_changes_timeout_cb
-        )
-
-    def __cancel_watch_changes_timeout(self):
-        if self.__watch_changes_timeout_source:
-            GLib.source_remove(self.__watch_changes_timeout_source)
-            self.__watch_changes_timeout_source = None
-
-    def __watch_changes_timeout_cb(self):
-        if self.__kolibri_service.context.pop_has_changes():
-            self.__update_cached_properties()
-        return GLib.SOURCE_CONTINUE
-
-    def __update_cached_properties(self):
+    def update_cached_properties(self):
         self.__skeleton.props.app_key = self.__kolibri_service.context.app_key
         self.__skeleton.props.base_url = self.__kolibri_service.context.base_url
         self.__skeleton.props.extra_url = self.__kolibri_service.context.extra_url
@@ -434,6 +414,7 @@ class Application(Gio.Application):
 
     __hold_tokens: set
     __system_name_id: typing.Optional[int] = None
+    __watch_changes_source: typing.Optional[int] = None
 
     def __init__(
         self,
@@ -492,7 +473,10 @@ class Application(Gio.Application):
             None,
         )
 
-        self.__begin_await_kolibri_bus_ready_timeout()
+        # Keep running at least until the Kolibri service is ready, even if no
+        # clients connect in the meantime.
+        self.hold_with_token(self.__kolibri_service)
+        self.__begin_watch_changes()
 
     @property
     def use_session_bus(self) -> bool:
@@ -578,6 +562,8 @@ class Application(Gio.Application):
             Gio.bus_unown_name(self.__system_name_id)
             self.__system_name_id = 0
 
+        self.__cancel_watch_changes()
+
         self.__public_interface.shutdown()
         self.__private_interface.shutdown()
 
@@ -587,21 +573,31 @@ class Application(Gio.Application):
 
         Gio.Application.do_shutdown(self)
 
-    def __begin_await_kolibri_bus_ready_timeout(self):
-        self.hold()
-        GLib.timeout_add_seconds(1, self.__await_kolibri_bus_ready_timeout_cb)
+    def __begin_watch_changes(self):
+        if self.__watch_changes_source:
+            return
+        self.__watch_changes_source = GLib.unix_fd_add_full(
+            GLib.PRIORITY_DEFAULT,
+            self.__kolibri_service.context.changes_fileno,
+            GLib.IOCondition.IN,
+            self.__watch_changes_cb,
+        )
 
-    def __cancel_await_kolibri_bus_ready_timeout(self):
-        if self.__await_kolibri_bus_ready_timeout_source:
-            GLib.source_remove(self.__await_kolibri_bus_ready_timeout_source)
-            self.__await_kolibri_bus_ready_timeout_source = None
+    def __cancel_watch_changes(self):
+        if self.__watch_changes_source:
+            GLib.source_remove(self.__watch_changes_source)
+            self.__watch_changes_source = None
 
-    def __await_kolibri_bus_ready_timeout_cb(self) -> bool:
-        if not self.__kolibri_service.context.is_bus_ready:
+    def __watch_changes_cb(self, fd: int, condition: GLib.IOCondition) -> bool:
+        if not self.__kolibri_service.context.pop_has_changes():
             return GLib.SOURCE_CONTINUE
 
-        self.release()
-        return GLib.SOURCE_REMOVE
+        self.__public_interface.update_cached_properties()
+
+        if self.__kolibri_service.context.is_bus_ready:
+            self.release_with_token(self.__kolibri_service)
+
+        return GLib.SOURCE_CONTINUE
 
     def __system_bus_on_get(self, source: GLib.Object, result: Gio.AsyncResult):
         connection = Gio.bus_get_finish(result)
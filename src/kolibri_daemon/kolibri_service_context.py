@@ -21,6 +21,8 @@ class KolibriServiceContext(object):
     KOLIBRI_HOME_LENGTH: int = 4096
 
     __changed_event: multiprocessing.synchronize.Event
+    __changed_rx: multiprocessing.connection.Connection
+    __changed_tx: multiprocessing.connection.Connection
 
     __is_bus_ready_value: multiprocessing.sharedctypes.Synchronized[c_bool]
     __is_bus_ready_set_event: multiprocessing.synchronize.Event
@@ -60,6 +62,7 @@ class KolibriServiceContext(object):
 
     def __init__(self):
         self.__changed_event = multiprocessing.Event()
+        self.__changed_rx, self.__changed_tx = multiprocessing.Pipe(duplex=False)
 
         self.__is_bus_ready_value = multiprocessing.Value(c_bool)
         self.__is_bus_ready_set_event = multiprocessing.Event()
@@ -95,12 +98,30 @@ class KolibriServiceContext(object):
         )
         self.__kolibri_version_set_event = multiprocessing.Event()
 
+    @property
+    def changes_fileno(self) -> int:
+        """
+        A file descriptor which becomes readable when there are changes. Use
+        this to watch for changes from a main loop, and then call
+        pop_has_changes.
+        """
+
+        return self.__changed_rx.fileno()
+
     def push_has_changes(self):
-        self.__changed_event.set()
+        # Only write to the pipe for the first change since the last call to
+        # pop_has_changes, so it never fills up while nobody is reading.
+        if not self.__changed_event.is_set():
+            self.__changed_event.set()
+            self.__changed_tx.send_bytes(b"\0")
 
     def pop_has_changes(self) -> bool:
-        # TODO: It would be better to use a multiprocessing.Condition and wait()
-        #       on it, but this does not play nicely with GLib's main loop.
+        # Drain the pipe before clearing the event. If a change is pushed in
+        # between, its values are already visible to the caller, and any later
+        # change will write to the pipe again.
+        while self.__changed_rx.poll():
+            self.__changed_rx.recv_bytes()
+
         if self.__changed_event.is_set():
             self.__changed_event.clear()
             return True
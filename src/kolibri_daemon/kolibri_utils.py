@@ -86,7 +86,7 @@ def _enable_kolibri_plugin(plugin_name: str, optional=False) -> bool:
         return False
 
     if plugin_name not in plugins_config.ACTIVE_PLUGINS:
-        logger.info(f"Enabling plugin {plugin_name}")
+        logger.info("Enabling plugin %s", plugin_name)
         enable_plugin(plugin_name)
 
     return True
@@ -97,7 +97,7 @@ def _disable_kolibri_plugin(plugin_name: str, optional=False) -> bool:
     from kolibri.plugins.utils import disable_plugin
 
     if plugin_name in plugins_config.ACTIVE_PLUGINS:
-        logger.info(f"Disabling plugin {plugin_name}")
+        logger.info("Disabling plugin %s", plugin_name)
         disable_plugin(plugin_name)
 
     return True
@@ -6,7 +6,6 @@ import typing
 from functools import partial
 from gettext import gettext as _
 from pathlib import Path
-from urllib.parse import urlsplit
 
 from gi.repository import Adw
 from gi.repository import Gio
@@ -14,15 +13,15 @@ from gi.repository import GLib
 from gi.repository import GObject
 from gi.repository import Gtk
 from gi.repository import WebKit
-from kolibri_app.config import APP_URI_SCHEME
 from kolibri_app.config import BASE_APPLICATION_ID
 from kolibri_app.config import BASE_OBJECT_PATH
 from kolibri_app.config import KOLIBRI_APP_DATA_DIR
-from kolibri_app.config import KOLIBRI_URI_SCHEME
 from kolibri_app.globals import get_release_notes_version
 from kolibri_app.globals import get_version
 from kolibri_app.globals import XDG_CURRENT_DESKTOP
 
+from .kolibri_context import APP_URL_PREFIX
+from .kolibri_context import KOLIBRI_URL_PREFIX
 from .kolibri_context import KolibriChannelContext
 from .kolibri_context import KolibriContext
 from .kolibri_webview import KolibriWebView
@@ -30,6 +29,14 @@ from .kolibri_window import KolibriWindow
 
 logger = logging.getLogger(__name__)
 
+OPEN_URL_PREFIXES = (KOLIBRI_URL_PREFIX, APP_URL_PREFIX)
+
+# Maximize windows on Endless OS. Typically $XDG_CURRENT_DESKTOP will be
+# `endless:GNOME` or `Endless:GNOME`.
+MAXIMIZE_WINDOWS = bool(
+    XDG_CURRENT_DESKTOP and "endless" in XDG_CURRENT_DESKTOP.lower().split(":")
+)
+
 
 class Application(Adw.Application):
     __context: KolibriContext
@@ -88,8 +95,32 @@ class Application(Adw.Application):
             self.open_kolibri_window()
 
     def do_open(self, files: typing.List[Gio.File], files_count: int, hint: str):
+        urls = []
+
         for file in files:
-            self.__handle_open_file_url(file.get_uri())
+            url = file.get_uri()
+            if url.startswith(OPEN_URL_PREFIXES):
+                urls.append(url)
+            else:
+                logger.info("Invalid URL scheme: %s", url)
+
+        if not urls:
+            return
+
+        # The first URL replaces the content of the active window, if there is
+        # one. Any other URLs are opened in new windows, rather than replacing
+        # each other in the same window.
+
+        first_url, *other_urls = urls
+        active_window = self.get_active_window()
+
+        if isinstance(active_window, KolibriWindow):
+            active_window.load_kolibri_url(first_url, present=True)
+        else:
+            self.open_kolibri_window(first_url)
+
+        for url in other_urls:
+            self.open_kolibri_window(url)
 
     def do_shutdown(self):
         Adw.Application.do_shutdown(self)
@@ -129,9 +160,20 @@ class Application(Adw.Application):
         self.quit()
 
     def open_url_in_external_application(self, url: str):
-        url_file = Gio.File.new_for_uri(url)
-        file_launcher = Gtk.FileLauncher.new(url_file)
-        file_launcher.launch(None, None, None)
+        uri_launcher = Gtk.UriLauncher.new(url)
+        uri_launcher.launch(None, None, self.__uri_launcher_on_launch)
+
+    def __uri_launcher_on_launch(
+        self, uri_launcher: Gtk.UriLauncher, result: Gio.AsyncResult
+    ):
+        try:
+            uri_launcher.launch_finish(result)
+        except GLib.Error as error:
+            logger.warning(
+                "Error opening URL %s in external application: %s",
+                uri_launcher.get_uri(),
+                error,
+            )
 
     def open_kolibri_window(
         self, target_url: typing.Optional[str] = None, **kwargs
@@ -147,9 +189,7 @@ class Application(Adw.Application):
         window.connect("open-new-window", self.__window_on_open_new_window)
         window.load_kolibri_url(target_url, present=True)
 
-        # Maximize windows on Endless OS. Typically $XDG_CURRENT_DESKTOP will be
-        # `endless:GNOME` or `Endless:GNOME`.
-        if XDG_CURRENT_DESKTOP and "endless" in XDG_CURRENT_DESKTOP.lower().split(":"):
+        if MAXIMIZE_WINDOWS:
             window.maximize()
 
         window.connect("auto-close", self.__kolibri_window_on_auto_close)
@@ -247,22 +287,6 @@ class Application(Adw.Application):
         )
         return new_window.get_main_webview() if new_window else None
 
-    def __handle_open_file_url(self, url: str):
-        valid_url_schemes = (KOLIBRI_URI_SCHEME, APP_URI_SCHEME)
-
-        url_tuple = urlsplit(url)
-
-        if url_tuple.scheme not in valid_url_schemes:
-            logger.info("Invalid URL scheme: %s", url)
-            return
-
-        active_window = self.get_active_window()
-
-        if isinstance(active_window, KolibriWindow):
-            active_window.load_kolibri_url(url, present=True)
-        else:
-            self.open_kolibri_window(url)
-
 
 class ChannelApplication(Application):
     __channel_id: str
@@ -277,7 +301,7 @@ class ChannelApplication(Application):
 
     def __context_on_kolibri_ready(self, context: KolibriContext):
         context.kolibri_api_get_async(
-            "/api/content/channel/{channel_id}".format(channel_id=self.__channel_id),
+            f"/api/content/channel/{self.__channel_id}",
             result_cb=self.__on_kolibri_api_channel_response,
         )
 
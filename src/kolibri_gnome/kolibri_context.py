@@ -4,7 +4,7 @@ import logging
 import re
 import typing
 from pathlib import Path
-from urllib.parse import parse_qs
+from urllib.parse import parse_qsl
 from urllib.parse import quote
 from urllib.parse import SplitResult
 from urllib.parse import urlsplit
@@ -31,10 +31,36 @@ logger = logging.getLogger(__name__)
 
 LEARN_PATH_PREFIX = "/explore/#/"
 
-STATIC_PATHS_RE = r"^(app|static|downloadcontent|content\/storage|content\/static|content\/zipcontent)\/?"
-SYSTEM_PATHS_RE = r"^(?P<lang>[\w\-]+\/)?(user|logout|redirectuser|explore\/app)\/?"
-AUTH_PLUGIN_PATHS_RE = r"^(?P<lang>[\w\-]+\/)?kolibri_desktop_auth_plugin\/?"
-CONTENT_PATHS_RE = r"^(?P<lang>[\w\-]+\/)?explore\/?"
+KOLIBRI_URL_PREFIX = f"{KOLIBRI_URI_SCHEME}:"
+APP_URL_PREFIX = f"{APP_URI_SCHEME}:"
+
+LOADER_URL = Path(ENDLESS_KEY_DATA_DIR, "loading-screen", "index.html").as_uri()
+LOADER_URLS = {
+    state: f"{LOADER_URL}#/loading/{state}"
+    for state in ("default", "error", "initial", "retry")
+}
+
+# URLs with these prefixes are always opened inside the application.
+INTERNAL_URL_PREFIXES = (KOLIBRI_URL_PREFIX, APP_URL_PREFIX, "about:", "blob:")
+
+# Kolibri paths with these prefixes are served as files rather than pages, so
+# they are never in scope for the application's windows.
+OUT_OF_SCOPE_PATH_PREFIXES = ("static/", "content/storage/")
+
+STATIC_PATHS_RE = re.compile(
+    r"^(?:app|static|downloadcontent|content\/storage|content\/static|content\/zipcontent)\/?"
+)
+SYSTEM_PATHS_RE = re.compile(
+    r"^(?:[\w\-]+\/)?(?:user|logout|redirectuser|explore\/app)\/?"
+)
+AUTH_PLUGIN_PATHS_RE = re.compile(r"^(?:[\w\-]+\/)?kolibri_desktop_auth_plugin\/?")
+CONTENT_PATHS_RE = re.compile(r"^(?:[\w\-]+\/)?explore\/?")
+
+# Matches either a learn page which is allowed in any channel, or a topic or
+# content node page with the node's ID.
+LEARN_FRAGMENT_RE = re.compile(
+    r"^(?:(?P<passthrough>content-unavailable|search)|topics\/(?:[ct]\/)?(?P<node_id>\w+))"
+)
 
 
 class KolibriContext(GObject.GObject):
@@ -50,7 +76,6 @@ class KolibriContext(GObject.GObject):
     __webkit_web_context: WebKit.WebContext
     __kolibri_daemon: KolibriDaemonManager
     __setup_helper: _KolibriSetupHelper
-    __loader_url: str
 
     SESSION_STATUS_LOADING = 0
     SESSION_STATUS_READY = 1
@@ -75,9 +100,6 @@ class KolibriContext(GObject.GObject):
             cookies_filename.as_posix(), WebKit.CookiePersistentStorage.SQLITE
         )
 
-        loader_path = Path(ENDLESS_KEY_DATA_DIR, "loading-screen", "index.html")
-        self.__loader_url = loader_path.as_uri()
-
         self.__webkit_web_context = WebKit.WebContext()
         self.__webkit_web_context.set_cache_model(WebKit.CacheModel.DOCUMENT_VIEWER)
 
@@ -115,12 +137,13 @@ class KolibriContext(GObject.GObject):
         self.__kolibri_daemon.shutdown()
 
     def get_absolute_url(self, url: str) -> typing.Optional[str]:
-        url_tuple = urlsplit(url)
-        if url_tuple.scheme == KOLIBRI_URI_SCHEME:
-            target_url = self.parse_kolibri_url_tuple(url_tuple)
+        # Check the scheme before splitting the URL, so other URLs are
+        # returned without being parsed at all.
+        if url.startswith(KOLIBRI_URL_PREFIX):
+            target_url = self.parse_kolibri_url_tuple(urlsplit(url))
             return self.__kolibri_daemon.get_absolute_url(target_url)
-        elif url_tuple.scheme == APP_URI_SCHEME:
-            target_url = self.parse_x_kolibri_app_url_tuple(url_tuple)
+        elif url.startswith(APP_URL_PREFIX):
+            target_url = self.parse_x_kolibri_app_url_tuple(urlsplit(url))
             return self.__kolibri_daemon.get_absolute_url(target_url)
         return url
 
@@ -131,23 +154,17 @@ class KolibriContext(GObject.GObject):
         self.__kolibri_daemon.kolibri_api_get_async(*args, **kwargs)
 
     def should_open_url(self, url: str) -> bool:
-        return (
-            url == self.default_url
-            or urlsplit(url).scheme
-            in (KOLIBRI_URI_SCHEME, APP_URI_SCHEME, "about", "blob")
-            or self.is_url_in_scope(url)
-        )
+        # This covers default_url, which always uses the x-kolibri-app scheme.
+        return url.startswith(INTERNAL_URL_PREFIXES) or self.is_url_in_scope(url)
 
     def default_is_url_in_scope(self, url: str) -> bool:
         if not self.__kolibri_daemon.is_url_in_scope(url):
             return False
 
         url_tuple = urlsplit(url)
-        url_path = url_tuple.path.lstrip("/")
+        url_path = url_tuple.path.removeprefix("/")
 
-        return not (
-            url_path.startswith("static/") or url_path.startswith("content/storage/")
-        )
+        return not url_path.startswith(OUT_OF_SCOPE_PATH_PREFIXES)
 
     def is_url_in_scope(self, url: str) -> bool:
         return self.default_is_url_in_scope(url)
@@ -168,14 +185,7 @@ class KolibriContext(GObject.GObject):
         }
 
     def get_loader_url(self, state: str) -> str:
-        if state == "error":
-            return f"{self.__loader_url}#/loading/error"
-        if state == "initial":
-            return f"{self.__loader_url}#/loading/initial"
-        if state == "retry":
-            return f"{self.__loader_url}#/loading/retry"
-        else:
-            return f"{self.__loader_url}#/loading/default"
+        return LOADER_URLS.get(state, LOADER_URLS["default"])
 
     def parse_kolibri_url_tuple(self, url_tuple: SplitResult) -> str:
         """
@@ -191,16 +201,27 @@ class KolibriContext(GObject.GObject):
         - kolibri:?search=addition
         """
 
-        url_path = url_tuple.path.lstrip("/")
-        url_query = parse_qs(url_tuple.query, keep_blank_values=True)
-        url_context = url_query.get("context", [])
-        url_search = " ".join(url_query.get("search", []))
+        url_path = url_tuple.path.removeprefix("/")
 
-        node_type, _, node_id = url_path.partition("/")
         # With the search provider, a content node can be activated in the
         # context of a specific Kolibri channel. We use this information for the
         # Explore plugin to display the content correctly.
-        channel_id = url_context[0] if url_context else None
+        channel_id = None
+        url_search_terms = []
+
+        # Most URLs do not have a query string, so skip parsing it if possible.
+        # Otherwise, we only care about two keys, so walk the query string once
+        # instead of building a dictionary of every key with parse_qs.
+        if url_tuple.query:
+            for key, value in parse_qsl(url_tuple.query, keep_blank_values=True):
+                if key == "context" and channel_id is None:
+                    channel_id = value
+                elif key == "search":
+                    url_search_terms.append(value)
+
+        url_search = " ".join(url_search_terms)
+
+        node_type, _, node_id = url_path.partition("/")
 
         # TODO: These URL generators have been crudely patched downstream.
         #       Instead, we should move this type of code to a plugin specific
@@ -226,7 +247,7 @@ class KolibriContext(GObject.GObject):
             return f"{LEARN_PATH_PREFIX}home"
 
     def url_to_x_kolibri_app(self, url: str) -> str:
-        return urlsplit(url)._replace(scheme=APP_URI_SCHEME, netloc="").geturl()
+        return APP_URL_PREFIX + _url_tuple_to_relative_url(urlsplit(url))
 
     def parse_x_kolibri_app_url_tuple(self, url_tuple: SplitResult) -> str:
         """
@@ -236,7 +257,7 @@ class KolibriContext(GObject.GObject):
 
         - x-kolibri-app:/device
         """
-        return url_tuple._replace(scheme="", netloc="").geturl()
+        return _url_tuple_to_relative_url(url_tuple)
 
     def open_external_url(self, url: str):
         if self.default_is_url_in_scope(url):
@@ -387,11 +408,13 @@ class KolibriChannelContext(KolibriContext):
     """
 
     __channel_id: str
+    __contentnode_channels: typing.Dict[str, str]
 
     def __init__(self, channel_id: str):
         super().__init__()
 
         self.__channel_id = channel_id
+        self.__contentnode_channels = {}
 
     @property
     def default_url(self) -> str:
@@ -419,48 +442,65 @@ class KolibriChannelContext(KolibriContext):
             return False
 
         url_tuple = urlsplit(url)
-        url_path = url_tuple.path.lstrip("/")
+        url_path = url_tuple.path.removeprefix("/")
 
-        if re.match(STATIC_PATHS_RE, url_path):
+        if STATIC_PATHS_RE.match(url_path):
             return True
-        elif re.match(SYSTEM_PATHS_RE, url_path):
+        elif SYSTEM_PATHS_RE.match(url_path):
             return True
-        elif re.match(AUTH_PLUGIN_PATHS_RE, url_path):
+        elif AUTH_PLUGIN_PATHS_RE.match(url_path):
             return True
-        elif re.match(CONTENT_PATHS_RE, url_path):
+        elif CONTENT_PATHS_RE.match(url_path):
             return self.__is_learn_fragment_in_channel(url_tuple.fragment)
         else:
             return False
 
     def __is_learn_fragment_in_channel(self, fragment: str) -> bool:
-        fragment = fragment.lstrip("/")
+        fragment = fragment.removeprefix("/")
+        match = LEARN_FRAGMENT_RE.match(fragment)
 
-        if re.match(r"^(content-unavailable|search)", fragment):
-            return True
+        if not match:
+            return False
 
-        contentnode_id = self.__contentnode_id_for_learn_fragment(fragment)
+        if match.group("passthrough"):
+            return True
 
-        if contentnode_id is None:
-            return False
+        contentnode_id = match.group("node_id")
 
         if contentnode_id == self.__channel_id:
             return True
 
+        return self.__get_contentnode_channel(contentnode_id) == self.__channel_id
+
+    def __get_contentnode_channel(self, contentnode_id: str) -> typing.Optional[str]:
+        # A content node always belongs to the same channel, so we only need to
+        # ask Kolibri once for each node. Failed lookups are not remembered,
+        # because they usually mean Kolibri is not ready yet.
+
+        contentnode_channel = self.__contentnode_channels.get(contentnode_id)
+
+        if contentnode_channel:
+            return contentnode_channel
+
         response = self.kolibri_api_get(f"/api/content/contentnode/{contentnode_id}")
 
         if not isinstance(response, dict):
-            return False
+            return None
 
         contentnode_channel = response.get("channel_id")
 
-        return contentnode_channel == self.__channel_id
+        if contentnode_channel:
+            self.__contentnode_channels[contentnode_id] = contentnode_channel
+
+        return contentnode_channel
 
-    def __contentnode_id_for_learn_fragment(
-        self, fragment: str
-    ) -> typing.Optional[str]:
-        pattern = r"^topics\/([ct]\/)?(?P<node_id>\w+)"
-        match = re.match(pattern, fragment)
-        if match:
-            return match.group("node_id")
 
-        return None
+def _url_tuple_to_relative_url(url_tuple: SplitResult) -> str:
+    # Equivalent to url_tuple._replace(scheme="", netloc="").geturl(), without
+    # creating a new SplitResult only to join it back together.
+    url = url_tuple.path
+    if url_tuple.query:
+        url += "?" + url_tuple.query
+    if url_tuple.fragment:
+        url += "#" + url_tuple.fragment
+    return url
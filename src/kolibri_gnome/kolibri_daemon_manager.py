@@ -24,6 +24,12 @@ logger = logging.getLogger(__name__)
 
 APP_KEY_COOKIE_NAME = "app_key_cookie"
 
+# Properties of KolibriDaemonDBus.MainProxy which affect KolibriDaemonManager's
+# own state. Changes to other properties are ignored. GDBusProxy reloads its
+# cached properties without notifying each of them when g-name-owner changes,
+# so that counts as a change to all of them.
+DBUS_PROXY_STATE_PROPERTIES = ("g-name-owner", "status", "base-url", "app-key")
+
 
 class KolibriDaemonManager(GObject.GObject):
     """
@@ -33,9 +39,13 @@ class KolibriDaemonManager(GObject.GObject):
 
     __bus_type: Gio.BusType
     __dbus_proxy: KolibriDaemonDBus.MainProxy
+    __soup_session: Soup.Session
 
     __did_init: bool = False
     __dbus_proxy_owner: typing.Optional[str] = None
+    __dbus_proxy_update_source: typing.Optional[int] = None
+    __base_url: str = ""
+    __extra_url: str = ""
 
     is_stopped = GObject.Property(type=bool, default=False)
     is_started = GObject.Property(type=bool, default=False)
@@ -60,10 +70,17 @@ class KolibriDaemonManager(GObject.GObject):
         self.__dbus_proxy.connect(
             "notify::g-name-owner", self.__dbus_proxy_on_notify_g_name_owner
         )
-        self.__dbus_proxy.connect("notify", self.__dbus_proxy_on_notify)
+        for prop in DBUS_PROXY_STATE_PROPERTIES:
+            self.__dbus_proxy.connect(f"notify::{prop}", self.__dbus_proxy_on_notify)
+        self.__dbus_proxy.connect("notify::base-url", self.__dbus_proxy_on_notify_url)
+        self.__dbus_proxy.connect("notify::extra-url", self.__dbus_proxy_on_notify_url)
 
         self.connect("notify::is-stopped", self.__on_notify_is_stopped)
 
+        # Share a single session for all requests to Kolibri's HTTP API so
+        # connections to the Kolibri server can be kept alive and reused.
+        self.__soup_session = Soup.Session.new()
+
     @property
     def do_automatic_login(self) -> bool:
         return APP_AUTOMATIC_LOGIN
@@ -86,26 +103,24 @@ class KolibriDaemonManager(GObject.GObject):
             try:
                 self.__dbus_proxy.call_release_sync()
             except GLib.Error as error:
-                logger.warning(
-                    "Error calling Kolibri daemon release: {error}".format(error=error)
-                )
+                logger.warning("Error calling Kolibri daemon release: %s", error)
 
     def is_url_in_scope(self, url: str) -> bool:
         return self.__is_base_url(url) or self.__is_extra_url(url)
 
     def __is_base_url(self, url: str) -> bool:
-        base_url = self.__dbus_proxy.props.base_url
-        return base_url and url.startswith(base_url)
+        base_url = self.__base_url
+        return bool(base_url) and url.startswith(base_url)
 
     def __is_extra_url(self, url: str) -> bool:
-        extra_url = self.__dbus_proxy.props.extra_url
-        return extra_url and url.startswith(extra_url)
+        extra_url = self.__extra_url
+        return bool(extra_url) and url.startswith(extra_url)
 
     def get_absolute_url(self, url: str = "") -> typing.Optional[str]:
         if self.is_url_in_scope(url):
             return url
-        elif self.__dbus_proxy.props.base_url:
-            return urljoin(self.__dbus_proxy.props.base_url, url)
+        elif self.__base_url:
+            return urljoin(self.__base_url, url)
         else:
             return None
 
@@ -125,9 +140,8 @@ class KolibriDaemonManager(GObject.GObject):
         if not url:
             return None
 
-        soup_session = Soup.Session.new()
         soup_message = Soup.Message.new("GET", url)
-        stream = soup_session.send(soup_message, None)
+        stream = self.__soup_session.send(soup_message, None)
         return _read_json_from_input_stream(stream)
 
     def kolibri_api_get_async(self, path: str, result_cb: typing.Callable):
@@ -159,14 +173,13 @@ class KolibriDaemonManager(GObject.GObject):
             result_cb(None)
             return
 
-        soup_session = Soup.Session.new()
         soup_message = Soup.Message.new(method, url)
         if request_body is not None:
             soup_message.set_request_body_from_bytes(
                 "application/json",
                 GLib.Bytes(self.__request_body_object_to_bytes(request_body)),
             )
-        soup_session.send_async(
+        self.__soup_session.send_async(
             soup_message,
             GLib.PRIORITY_DEFAULT,
             None,
@@ -188,7 +201,7 @@ class KolibriDaemonManager(GObject.GObject):
         if soup_message.get_status() >= Soup.Status.BAD_REQUEST:
             # FIXME: It would be better to raise an exception, and
             # handle it in the other side to set SESSION_STATUS_ERROR.
-            logger.warning(f"Error calling Kolibri API: {soup_message.get_status()}")
+            logger.warning("Error calling Kolibri API: %s", soup_message.get_status())
             result_cb(None)
             return
 
@@ -209,7 +222,7 @@ class KolibriDaemonManager(GObject.GObject):
         login_token_ready_cb: typing.Callable,
     ):
         if isinstance(result, Exception):
-            logger.warning("Error creating login token: {}".format(result))
+            logger.warning("Error creating login token: %s", result)
             login_token_ready_cb(self, None)
         else:
             login_token_ready_cb(self, result)
@@ -218,9 +231,7 @@ class KolibriDaemonManager(GObject.GObject):
         try:
             self.__dbus_proxy.init_finish(result)
         except GLib.Error as error:
-            logger.warning(
-                "Error initializing Kolibri daemon proxy: {error}".format(error=error)
-            )
+            logger.warning("Error initializing Kolibri daemon proxy: %s", error)
             self.props.has_error = True
         else:
             self.__dbus_proxy_on_notify_g_name_owner(self.__dbus_proxy)
@@ -230,6 +241,10 @@ class KolibriDaemonManager(GObject.GObject):
         dbus_proxy: KolibriDaemonDBus.MainProxy,
         param_spec: GObject.ParamSpec = None,
     ):
+        # The proxy reloads its cached properties for a new owner without
+        # emitting notify for each of them.
+        self.__dbus_proxy_on_notify_url(dbus_proxy)
+
         dbus_proxy_owner = dbus_proxy.get_name_owner()
         dbus_proxy_owner_changed = bool(self.__dbus_proxy_owner != dbus_proxy_owner)
         self.__dbus_proxy_owner = dbus_proxy_owner
@@ -238,9 +253,39 @@ class KolibriDaemonManager(GObject.GObject):
             dbus_proxy.Hold(result_handler=self.__dbus_proxy_default_result_handler)
             self.emit("dbus-owner-changed")
 
+    def __dbus_proxy_on_notify_url(
+        self,
+        dbus_proxy: KolibriDaemonDBus.MainProxy,
+        param_spec: GObject.ParamSpec = None,
+    ):
+        # is_url_in_scope is called for every navigation in every window, so
+        # keep our own copy of these URLs instead of reading them from the
+        # proxy's property cache each time. Unlike the rest of our state, they
+        # are updated immediately so callers never see an outdated URL.
+        self.__base_url = dbus_proxy.props.base_url or ""
+        self.__extra_url = dbus_proxy.props.extra_url or ""
+
     def __dbus_proxy_on_notify(
         self, dbus_proxy: KolibriDaemonDBus.MainProxy, param_spec: GObject.ParamSpec
     ):
+        # The proxy emits a separate notify signal for each property that
+        # changes, and kolibri-daemon usually changes several properties at
+        # once. Wait until the main loop is idle so we only need to update our
+        # own state once for each batch of changes.
+
+        if self.__dbus_proxy_update_source:
+            return
+
+        self.__dbus_proxy_update_source = GLib.idle_add(
+            self.__dbus_proxy_update_idle_cb
+        )
+
+    def __dbus_proxy_update_idle_cb(self) -> bool:
+        self.__dbus_proxy_update_source = None
+        self.__update_from_dbus_proxy(self.__dbus_proxy)
+        return GLib.SOURCE_REMOVE
+
+    def __update_from_dbus_proxy(self, dbus_proxy: KolibriDaemonDBus.MainProxy):
         is_stopped = dbus_proxy.props.status in ("STOPPED", "")
         is_started = dbus_proxy.props.status == "STARTED"
         has_error = dbus_proxy.props.status == "ERROR"
@@ -292,7 +337,7 @@ class KolibriDaemonManager(GObject.GObject):
         user_data: typing.Any = None,
     ):
         if isinstance(result, Exception):
-            logger.warning("Error communicating with Kolibri daemon: {}".format(result))
+            logger.warning("Error communicating with Kolibri daemon: %s", result)
             self.props.has_error = True
 
 
@@ -302,7 +347,5 @@ def _read_json_from_input_stream(stream: Gio.InputStream):
     try:
         return json.load(stream_io)
     except json.JSONDecodeError as error:
-        logger.warning(
-            "Error reading Kolibri API response: {error}".format(error=error)
-        )
+        logger.warning("Error reading Kolibri API response: %s", error)
         return None
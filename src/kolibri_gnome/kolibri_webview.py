@@ -288,15 +288,18 @@ class KolibriWebViewStack(Gtk.Stack):
         self.show_web_inspector = False
 
     def show_loading(self):
-        self.is_main_visible = False
-        loader_url = self.__context.get_loader_url("loading")
-        self.__loading_webview.load_uri(loader_url)
-        self.set_visible_child(self.__loading_webview)
+        self.__show_loader(self.__context.get_loader_url("loading"))
 
     def show_error(self):
+        self.__show_loader(self.__context.get_loader_url("error"))
+
+    def __show_loader(self, loader_url: str):
         self.is_main_visible = False
-        loader_url = self.__context.get_loader_url("error")
-        self.__loading_webview.load_uri(loader_url)
+        # The session status can be notified several times while Kolibri is
+        # starting, so avoid reloading the loading screen if it is already
+        # showing the same state.
+        if self.__loading_webview.get_uri() != loader_url:
+            self.__loading_webview.load_uri(loader_url)
         self.set_visible_child(self.__loading_webview)
 
     def show_main(self):
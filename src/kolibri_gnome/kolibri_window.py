@@ -98,7 +98,7 @@ class KolibriWindow(Adw.ApplicationWindow):
         )
         self.__header_bar.pack_end(menu_button)
 
-        menu_popover = Gtk.PopoverMenu.new_from_model(_KolibriWindowMenu())
+        menu_popover = Gtk.PopoverMenu.new_from_model(_KolibriWindowMenu.get_default())
         menu_button.set_popover(menu_popover)
 
         navigation_revealer = Gtk.Revealer(
@@ -298,28 +298,45 @@ class KolibriWindow(Adw.ApplicationWindow):
 
 
 class _KolibriWindowMenu(Gio.Menu):
+    # Each section is a tuple of (label, detailed action name) pairs. Empty
+    # sections are skipped.
+    SECTIONS = (
+        ((_("New Window"), "app.new-window"),),
+        (
+            (_("Reload"), "win.reload"),
+            (_("Actual Size"), "win.zoom-reset"),
+            (_("Zoom In"), "win.zoom-in"),
+            (_("Zoom Out"), "win.zoom-out"),
+        ),
+        (
+            ((_("Show Developer Tools"), "win.show-web-inspector"),)
+            if APP_DEVELOPER_EXTRAS
+            else ()
+        ),
+        (
+            (_("Help"), "app.open-documentation"),
+            (_("About Endless Key"), "app.about"),
+        ),
+    )
+
+    __default: typing.Optional[_KolibriWindowMenu] = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        main_section = Gio.Menu()
-        main_section.append_item(Gio.MenuItem.new(_("New Window"), "app.new-window"))
-        self.append_section(None, main_section)
-
-        view_section = Gio.Menu()
-        view_section.append_item(Gio.MenuItem.new(_("Reload"), "win.reload"))
-        view_section.append_item(Gio.MenuItem.new(_("Actual Size"), "win.zoom-reset"))
-        view_section.append_item(Gio.MenuItem.new(_("Zoom In"), "win.zoom-in"))
-        view_section.append_item(Gio.MenuItem.new(_("Zoom Out"), "win.zoom-out"))
-        self.append_section(None, view_section)
-
-        if APP_DEVELOPER_EXTRAS:
-            dev_section = Gio.Menu()
-            dev_section.append_item(
-                Gio.MenuItem.new(_("Show Developer Tools"), "win.show-web-inspector")
-            )
-            self.append_section(None, dev_section)
-
-        help_section = Gio.Menu()
-        help_section.append_item(Gio.MenuItem.new(_("Help"), "app.open-documentation"))
-        help_section.append_item(Gio.MenuItem.new(_("About Endless Key"), "app.about"))
-        self.append_section(None, help_section)
+        for section_items in self.SECTIONS:
+            if not section_items:
+                continue
+
+            section = Gio.Menu()
+            for label, detailed_action in section_items:
+                section.append_item(Gio.MenuItem.new(label, detailed_action))
+            self.append_section(None, section)
+
+    @classmethod
+    def get_default(cls) -> _KolibriWindowMenu:
+        # The menu is identical for every window and its items refer to
+        # actions by name, so all windows can share the same menu model.
+        if cls.__default is None:
+            cls.__default = cls()
+        return cls.__default
@@ -41,7 +41,7 @@ def main():
     logger.info("*  Kolibri GNOME App Initializing  *")
     logger.info("************************************")
     logger.info("")
-    logger.info("Started at: {}".format(datetime.datetime.today()))
+    logger.info("Started at: %s", datetime.datetime.today())
 
     from .application import Application
     from .application import ChannelApplication
@@ -71,7 +71,7 @@ def main():
 
     application.run([sys.argv[0], *extra_argv])
 
-    logger.info("Stopped at: {}".format(datetime.datetime.today()))
+    logger.info("Stopped at: %s", datetime.datetime.today())
 
 
 if __name__ == "__main__":
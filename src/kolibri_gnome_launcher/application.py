@@ -1,7 +1,5 @@
 import logging
-import subprocess
 from urllib.parse import urlsplit
-from urllib.parse import urlunparse
 
 from gi.repository import Gio
 from kolibri_app.config import DISPATCH_URI_SCHEME
@@ -10,6 +8,8 @@ from kolibri_app.config import LAUNCHER_APPLICATION_ID
 
 logger = logging.getLogger(__name__)
 
+DISPATCH_URI_PREFIX = f"{DISPATCH_URI_SCHEME}:"
+
 
 class Launcher(Gio.Application):
     """
@@ -41,16 +41,15 @@ class Launcher(Gio.Application):
             self.handle_uri(uri)
 
     def handle_uri(self, uri: str):
-        url_tuple = urlsplit(uri)
-
-        if url_tuple.scheme == DISPATCH_URI_SCHEME:
-            channel_id = url_tuple.netloc
-            node_path = url_tuple.path
-            node_query = url_tuple.query
-        else:
-            logger.info(f"Invalid URL scheme: {uri}")
+        if not uri.startswith(DISPATCH_URI_PREFIX):
+            logger.info("Invalid URL scheme: %s", uri)
             return
 
+        url_tuple = urlsplit(uri)
+        channel_id = url_tuple.netloc
+        node_path = url_tuple.path
+        node_query = url_tuple.query
+
         kolibri_gnome_args = []
 
         if channel_id and channel_id != "_":
@@ -60,9 +59,11 @@ class Launcher(Gio.Application):
         # specified, to open the requested content in kolibri-gnome.
 
         if node_path or node_query:
-            kolibri_node_url = urlunparse(
-                (KOLIBRI_URI_SCHEME, node_path, "", None, node_query, None)
-            )
+            kolibri_node_url = f"{KOLIBRI_URI_SCHEME}:{node_path}"
+            if node_query:
+                kolibri_node_url += f"?{node_query}"
             kolibri_gnome_args.append(kolibri_node_url)
 
-        subprocess.Popen(["kolibri-gnome", *kolibri_gnome_args])
+        Gio.Subprocess.new(
+            ["kolibri-gnome", *kolibri_gnome_args], Gio.SubprocessFlags.NONE
+        )
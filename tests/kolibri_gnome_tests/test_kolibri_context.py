@@ -1,5 +1,6 @@
 import unittest
 from urllib.parse import parse_qs
+from urllib.parse import SplitResult
 from urllib.parse import urlsplit
 
 from kolibri_gnome.kolibri_context import KolibriChannelContext
@@ -52,6 +53,25 @@ class TestKolibriContext(KolibriContextTestCase):
             f"{LEARN_PATH_PREFIX}topics/fedcba9/c/{self.CONTENT_ID}",
         )
 
+    def test_parse_kolibri_url_tuple_content_with_leading_slash(self):
+        self.assert_kolibri_path_equal(
+            self.kolibri_context.parse_kolibri_url_tuple(
+                urlsplit(f"kolibri:/c/{self.CONTENT_ID}?context=fedcba9")
+            ),
+            f"{LEARN_PATH_PREFIX}topics/fedcba9/c/{self.CONTENT_ID}",
+        )
+
+        # Only a single leading slash is ignored. urlsplit would treat "//" as
+        # the start of a netloc, so build the tuple directly.
+        self.assertNotEqual(
+            self.kolibri_context.parse_kolibri_url_tuple(
+                SplitResult(
+                    "kolibri", "", f"//c/{self.CONTENT_ID}", "context=fedcba9", ""
+                )
+            ),
+            f"{LEARN_PATH_PREFIX}topics/fedcba9/c/{self.CONTENT_ID}",
+        )
+
     def test_parse_kolibri_url_tuple_topic(self):
         self.assert_kolibri_path_equal(
             self.kolibri_context.parse_kolibri_url_tuple(
@@ -83,6 +103,46 @@ class TestKolibriContext(KolibriContextTestCase):
             f"{LEARN_PATH_PREFIX}search/addition%20and%20subtraction",
         )
 
+    def test_parse_kolibri_url_tuple_base_with_repeated_search(self):
+        self.assert_kolibri_path_equal(
+            self.kolibri_context.parse_kolibri_url_tuple(
+                urlsplit("kolibri:?search=addition&search=subtraction")
+            ),
+            f"{LEARN_PATH_PREFIX}search/addition%20subtraction",
+        )
+
+    def test_parse_x_kolibri_app_url_tuple(self):
+        self.assertEqual(
+            self.kolibri_context.parse_x_kolibri_app_url_tuple(
+                urlsplit("x-kolibri-app:/device")
+            ),
+            "/device",
+        )
+
+        self.assertEqual(
+            self.kolibri_context.parse_x_kolibri_app_url_tuple(
+                urlsplit("x-kolibri-app:/explore/?a=1#/topics/fedcba9")
+            ),
+            "/explore/?a=1#/topics/fedcba9",
+        )
+
+    def test_url_to_x_kolibri_app(self):
+        self.assertEqual(
+            self.kolibri_context.url_to_x_kolibri_app(
+                "http://127.0.0.1:8080/explore/?a=1#/topics/fedcba9"
+            ),
+            "x-kolibri-app:/explore/?a=1#/topics/fedcba9",
+        )
+
+    def test_get_loader_url(self):
+        self.assertTrue(
+            self.kolibri_context.get_loader_url("error").endswith("#/loading/error")
+        )
+        self.assertEqual(
+            self.kolibri_context.get_loader_url("loading"),
+            self.kolibri_context.get_loader_url("default"),
+        )
+
 
 class TestKolibriChannelContext(KolibriContextTestCase):
     CHANNEL_ID = "fedcba9"
@@ -98,6 +158,9 @@ class TestKolibriChannelContext(KolibriContextTestCase):
     def test_parse_kolibri_url_tuple_content_with_search(self):
         TestKolibriContext.test_parse_kolibri_url_tuple_content_with_search(self)
 
+    def test_parse_kolibri_url_tuple_content_with_leading_slash(self):
+        TestKolibriContext.test_parse_kolibri_url_tuple_content_with_leading_slash(self)
+
     def test_parse_kolibri_url_tuple_topic(self):
         TestKolibriContext.test_parse_kolibri_url_tuple_topic(self)
 